@@ -1,13 +1,56 @@
 import logging
 from typing import List, Dict
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import json
 from zenoti_utils.config import load_zenoti_config  # Import the config loader
 
+try:
+    import orjson
+except ImportError:  # Fall back to requests' stdlib-based JSON decoding
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional; Excel export works without pyarrow
+    pa = pq = None
+
+# Upper bound on organizations fetched concurrently
+MAX_FETCH_WORKERS = 16
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
+# Retry policy for throttled (429) and transient server/connection errors
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+# (connect, read) timeout in seconds; urllib3 only retries read errors when a read timeout is set
+REQUEST_TIMEOUT = (10, 60)
+
+# xlsxwriter options: write vendor strings verbatim instead of detecting URLs
+EXCEL_ENGINE_KWARGS = {'options': {'strings_to_urls': False}}
+
+# Vendors requested per page, and a safety cap on pages fetched per organization.
+# 100 is the page size known to be honoured by the vendors endpoint; larger sizes
+# can be tried through fetch_vendors' page_size once the API maximum is confirmed
+DEFAULT_PAGE_SIZE = 100
+HONOURED_PAGE_SIZE = 100
+MAX_PAGES = 10_000
+
+# Report date format without zero padding; the strftime flag differs on Windows
+REPORT_DATE_FORMAT = "%#m/%#d/%Y" if os.name == 'nt' else "%-m/%-d/%Y"
+
 # Configure logging
 def set_logging():
     logging.basicConfig(
@@ -16,21 +59,28 @@ def set_logging():
     )
 
 # Function to export data to a single Excel file with multiple sheets
-def export_orgs_to_excel(data: Dict[str, DataFrame], output_dir: str, report_name: str, date_str: str):
+def export_orgs_to_excel(data: Dict[str, DataFrame] | DataFrame, output_dir: str, report_name: str, date_str: str):
     """
     Export each organization's DataFrame to a separate sheet in a single Excel file.
     
     Args:
-        data: Dictionary of organization keys and their DataFrames.
+        data: Dictionary of organization keys and their DataFrames, or a combined
+            frame from get_vendors_frame.
         output_dir: Directory to save the Excel file.
         report_name: Name of the report for filename.
         date_str: Date string for the filename (e.g., '2025-10-06').
     """
+    data = drop_empty_orgs(data)
+    if not data:
+        logging.info(f"No vendors data to export; {report_name} Excel file not written")
+        return
+    
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, f"{report_name}_{date_str}.xlsx")
     
     try:
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        # xlsxwriter writes faster and with less memory than openpyxl
+        with pd.ExcelWriter(output_file, engine='xlsxwriter', engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
             for org, df in data.items():
                 df.to_excel(writer, sheet_name=org, index=False)
                 logging.info(f"Wrote {org} data to sheet '{org}' in {output_file}")
@@ -38,8 +88,129 @@ def export_orgs_to_excel(data: Dict[str, DataFrame], output_dir: str, report_nam
     except Exception as e:
         logging.error(f"Error saving to Excel file {output_file}: {e}", exc_info=True)
 
+# Worker for export_orgs_to_excel_files; module-level so it can be pickled
+def _write_org_workbook(org: str, df: DataFrame, output_dir: str, report_name: str, date_str: str) -> str:
+    output_file = os.path.join(output_dir, f"{report_name}_{org}_{date_str}.xlsx")
+    with pd.ExcelWriter(output_file, engine='xlsxwriter', engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
+        df.to_excel(writer, sheet_name=org, index=False)
+    return output_file
+
+# Function to export data to one Excel file per organization, in parallel
+def export_orgs_to_excel_files(data: Dict[str, DataFrame] | DataFrame, output_dir: str, report_name: str, date_str: str):
+    """
+    Export each organization's DataFrame to its own Excel file, writing the
+    files concurrently in separate processes.
+    
+    Args:
+        data: Dictionary of organization keys and their DataFrames, or a combined
+            frame from get_vendors_frame.
+        output_dir: Directory to save the Excel files.
+        report_name: Name of the report for filenames.
+        date_str: Date string for the filenames (e.g., '2025-10-06').
+    """
+    data = drop_empty_orgs(data)
+    if not data:
+        logging.info(f"No vendors data to export; {report_name} Excel files not written")
+        return
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    with ProcessPoolExecutor(max_workers=min(len(data), os.cpu_count() or 1)) as executor:
+        futures = {org: executor.submit(_write_org_workbook, org, df, output_dir, report_name, date_str)
+                   for org, df in data.items()}
+        for org, future in futures.items():
+            try:
+                logging.info(f"Saved Excel file for {org}: {future.result()}")
+            except Exception as e:
+                logging.error(f"Error saving Excel file for {org}: {e}", exc_info=True)
+
+# Function to export data to one Parquet file per organization
+def export_orgs_to_parquet(data: Dict[str, DataFrame] | DataFrame, output_dir: str, report_name: str, date_str: str):
+    """
+    Export each organization's DataFrame to a separate zstd-compressed Parquet file.
+    
+    Args:
+        data: Dictionary of organization keys and their DataFrames, or a combined
+            frame from get_vendors_frame.
+        output_dir: Directory to save the Parquet files.
+        report_name: Name of the report for filenames.
+        date_str: Date string for the filenames (e.g., '2025-10-06').
+    """
+    if pq is None:
+        logging.warning("pyarrow is not installed; skipping Parquet export")
+        return
+    
+    data = drop_empty_orgs(data)
+    if not data:
+        logging.info(f"No vendors data to export; {report_name} Parquet files not written")
+        return
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    for org, df in data.items():
+        output_file = os.path.join(output_dir, f"{report_name}_{org}_{date_str}.parquet")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            # Dictionary-encode repeated strings such as center_name
+            pq.write_table(table, output_file, compression='zstd', use_dictionary=True)
+            logging.info(f"Saved Parquet file for {org}: {output_file}")
+        except Exception as e:
+            logging.error(f"Error saving to Parquet file {output_file}: {e}", exc_info=True)
+
+# Function to build a pooled HTTP session shared across pages and organizations
+def create_session() -> requests.Session:
+    """
+    Create a requests Session whose HTTPS connections are pooled and reused.
+    
+    Connection errors and 429/5xx responses are retried with exponential
+    backoff, honouring the Retry-After header when the API sends one.
+    
+    Returns:
+        requests.Session with an HTTPAdapter mounted for https:// URLs.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        respect_retry_after_header=True,
+        raise_on_status=False  # Let raise_for_status report the final response
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+# Function to flatten one page of vendor records, keeping the API's key order
+def flatten_vendors_page(vendors: List[Dict]) -> DataFrame:
+    """
+    Flatten vendor records with pd.json_normalize, keeping columns in record key order.
+    
+    json_normalize moves flattened keys such as work_phone.number after all scalar keys
+    and emits no column at all for keys whose value is always an empty dict. Columns are
+    put back at their key's position, and such keys are kept as an all-null column.
+    
+    Args:
+        vendors: Vendor records from one API page.
+    
+    Returns:
+        DataFrame with one row per vendor.
+    """
+    page_frame = pd.json_normalize(vendors, max_level=1)
+    columns = []
+    for key in vendors[0]:
+        nested = [column for column in page_frame.columns if column.startswith(f'{key}.')]
+        if key not in page_frame.columns and not nested:
+            page_frame[key] = None
+        if key in page_frame.columns:
+            columns.append(key)
+        columns.extend(nested)
+    columns.extend(column for column in page_frame.columns if column not in columns)
+    return page_frame[columns]
+
 # Function to fetch vendor data for a specific organization
-def fetch_vendors(org: str, start_date: datetime, end_date: datetime, config: Dict) -> Dict:
+def fetch_vendors(org: str, start_date: datetime, end_date: datetime, config: Dict,
+                  session: requests.Session | None = None, page_size: int = DEFAULT_PAGE_SIZE,
+                  max_pages: int = MAX_PAGES) -> DataFrame | None:
     """
     Fetch vendor data from Zenoti API for a specific organization.
     
@@ -48,61 +219,150 @@ def fetch_vendors(org: str, start_date: datetime, end_date: datetime, config: Di
         start_date: Start date of the data period.
         end_date: End date of the data period.
         config: Configuration dictionary with centers_by_key and org_to_api_key mappings.
+        session: Shared HTTP session; a new one is created if not provided.
+        page_size: Number of vendors requested per page. Above HONOURED_PAGE_SIZE an
+            under-full page may just be the server's cap, so pagination then ends on the
+            reported total or an empty page instead.
+        max_pages: Maximum number of pages to fetch before giving up on further pages.
     
     Returns:
-        Dictionary containing the API response.
+        DataFrame of the organization's vendors with nested fields flattened,
+        or None if the data could not be fetched.
     """
     # Get API key from config
     api_key = config.get('org_to_api_key', {}).get(org.lower())
     if not api_key:
         logging.error(f"No API key found for organization: {org}")
-        return {}
+        return None
+    
+    if session is None:
+        # Own the session for this call only, so its connections are closed afterwards
+        with create_session() as session:
+            return fetch_vendors(org, start_date, end_date, config, session, page_size, max_pages)
     
     base_url = "https://api.zenoti.com/v1/vendors"
     headers = {
         'Authorization': f'apikey {api_key}'
     }
-    page = 1
-    size = 100
-    all_vendors = []
+    size = page_size
+    page_frames = []
+    fetched = 0
+    
+    # Only the page number changes between requests; build the rest of the query once.
+    # Assuming the API accepts start_date and end_date; adjust if needed
+    base_params = f"&size={size}&start_date={start_date.strftime('%Y-%m-%d')}&end_date={end_date.strftime('%Y-%m-%d')}"
     
     logging.debug(f"Fetching vendors for {org} from {start_date} to {end_date}")
     
-    while True:
-        # Assuming the API accepts start_date and end_date; adjust if needed
-        url = f"{base_url}?page={page}&size={size}&start_date={start_date.strftime('%Y-%m-%d')}&end_date={end_date.strftime('%Y-%m-%d')}"
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+    # Request the next page as soon as the current one is known not to be the last, then
+    # flatten the current page while that request is in flight. Only pages that are needed
+    # are ever requested, so no request outlives the loop except after an error
+    executor = ThreadPoolExecutor(max_workers=1)
+    
+    def request_page(page_number: int):
+        url = f"{base_url}?page={page_number}{base_params}"
+        return executor.submit(session.get, url, headers=headers, timeout=REQUEST_TIMEOUT)
+    
+    page = 1
+    future = request_page(page) if max_pages >= 1 else None
+    try:
+        while future is not None:
+            try:
+                response = future.result()
+                response.raise_for_status()
+                data = orjson.loads(response.content) if orjson is not None else response.json()
+            except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: invalid JSON body
+                logging.error(f"Error fetching page {page} for {org}: {e}", exc_info=True)
+                return None
             
             # Extract vendor records (adjust key based on actual API response)
             vendors = data.get('vendors', []) or data.get('data', [])
             if not vendors:
                 logging.debug(f"No more data for {org} on page {page}")
                 break
-                
-            # Map center IDs to names using config
-            centers = config['centers_by_key'].get(api_key, {})
-            for vendor in vendors:
-                if 'center_id' in vendor:
-                    vendor['center_name'] = centers.get(vendor['center_id'], vendor['center_id'])
-                    # Remove center_id to avoid duplication in output
-                    vendor.pop('center_id', None)
+            fetched += len(vendors)
+            
+            # Stop once the server's reported total is reached, or on an under-full page
+            # when the requested size is known to be honoured; otherwise wait for an empty page
+            page_info = data.get('page_info') or data.get('page_Info') or {}
+            total = page_info.get('total') if isinstance(page_info, dict) else None
+            future = None
+            if isinstance(total, int) and fetched >= total:
+                logging.debug(f"All {total} vendors for {org} fetched by page {page}")
+            elif size <= HONOURED_PAGE_SIZE and len(vendors) < size:
+                logging.debug(f"Last page for {org} reached on page {page}")
+            elif page >= max_pages:
+                logging.warning(f"Stopped fetching vendors for {org} after {max_pages} pages; results may be incomplete")
+            else:
+                future = request_page(page + 1)
             
-            all_vendors.extend(vendors)
+            # Convert each page as it arrives so raw records don't pile up alongside the frame
+            page_frames.append(flatten_vendors_page(vendors))
             page += 1
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching page {page} for {org}: {e}", exc_info=True)
-            return {}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    return {'vendors': all_vendors}
+    if not page_frames:
+        return DataFrame()
+    return pd.concat(page_frames, ignore_index=True)
 
-def get_vendors_report(organizations: List[str] | str,
-                       start_date: datetime,
-                       end_date: datetime) -> Dict[str, DataFrame]:
+# Function to split a combined vendors frame back into one DataFrame per organization
+def split_by_org(frame: DataFrame) -> Dict[str, DataFrame]:
     """
-    Fetch and format vendor data for one or multiple organizations.
+    Split a frame produced by get_vendors_frame into per-organization DataFrames.
+    
+    Args:
+        frame: Combined DataFrame with a categorical 'org' column. Each organization's
+            own columns and dtypes are read from frame.attrs['org_dtypes'] when present.
+    
+    Returns:
+        Dictionary of organization keys and their DataFrames, without the 'org'
+        column and with each organization's original columns and dtypes.
+    """
+    org_dtypes = frame.attrs.get('org_dtypes', {})
+    dataframes = {}
+    for org, group in frame.groupby('org', sort=False, observed=False):
+        group = group.drop(columns='org').reset_index(drop=True)
+        dtypes = org_dtypes.get(org)
+        if dtypes is not None:
+            group = group[list(dtypes)]
+            # Undo upcasts from columns other organizations lacked; shared categoricals stay as they are
+            restore = {column: dtype for column, dtype in dtypes.items()
+                       if group[column].dtype != dtype and not isinstance(group[column].dtype, pd.CategoricalDtype)}
+            group = group.astype(restore)
+        # Categoricals such as center_name are shared across orgs; keep only this org's values
+        for column in group.select_dtypes('category').columns:
+            group[column] = group[column].cat.remove_unused_categories()
+        # Slicing carries frame.attrs over; the dtype map is internal to the combined frame
+        group.attrs = {}
+        dataframes[org] = group
+    return dataframes
+
+# Function to drop organizations without vendors before exporting
+def drop_empty_orgs(data: Dict[str, DataFrame] | DataFrame) -> Dict[str, DataFrame]:
+    """
+    Drop organizations that have no vendors, logging a single warning naming them.
+    
+    Args:
+        data: Dictionary of organization keys and their DataFrames, or a combined
+            frame from get_vendors_frame.
+    
+    Returns:
+        Dictionary of organization keys and their non-empty DataFrames.
+    """
+    if isinstance(data, DataFrame):
+        data = split_by_org(data)
+    nonempty = {org: df for org, df in data.items() if len(df)}
+    skipped = [org for org in data if org not in nonempty]
+    if skipped:
+        logging.warning(f"Skipping organizations with no vendors data: {skipped}")
+    return nonempty
+
+def get_vendors_frame(organizations: List[str] | str,
+                      start_date: datetime,
+                      end_date: datetime) -> DataFrame:
+    """
+    Fetch and format vendor data for one or multiple organizations as a single DataFrame.
 
     Args:
         organizations (List[str] | str): Org key(s) such as ["lebanon", "kuwait"] or just "lebanon".
@@ -110,7 +370,8 @@ def get_vendors_report(organizations: List[str] | str,
         end_date (datetime): End date of the report period.
 
     Returns:
-        Dict[str, DataFrame]: Dictionary with org keys and cleaned DataFrames.
+        DataFrame: Cleaned vendors of all organizations, with a categorical 'org' column.
+        attrs['org_dtypes'] maps each organization to its own columns and dtypes.
     """
     logging.info(f"Fetching vendors report for organizations: {organizations} from {start_date} to {end_date}")
     
@@ -122,76 +383,119 @@ def get_vendors_report(organizations: List[str] | str,
         logging.debug(f"Converted organizations to list: {organizations}")
 
     # -------- Validate organizations --------
-    valid_orgs = [org for org in organizations if org.lower() in config.get('org_to_api_key', {})]
+    # Lowercase once and drop duplicates, keeping the caller's order
+    org_to_api_key = config.get('org_to_api_key', {})
+    requested_orgs = dict.fromkeys(org.lower() for org in organizations)
+    valid_orgs = [org for org in requested_orgs if org in org_to_api_key]
     if not valid_orgs:
         logging.error("No valid organizations found in config.")
         raise ValueError("No valid organizations found in config.")
     logging.debug(f"Valid organizations: {valid_orgs}")
 
     # -------- Fetch raw data --------
-    raw_data = {org: fetch_vendors(org, start_date, end_date, config) for org in valid_orgs}
-    logging.info(f"Fetched vendors data for {len(raw_data)} organizations")
+    # Requests are I/O-bound, so fan the organizations out over a thread pool
+    # sharing one session so connections to the API host are reused
+    with create_session() as session, \
+            ThreadPoolExecutor(max_workers=min(len(valid_orgs), MAX_FETCH_WORKERS)) as executor:
+        futures = {org: executor.submit(fetch_vendors, org, start_date, end_date, config, session)
+                   for org in valid_orgs}
+        # Pages arrive already flattened, with nested objects such as work_phone as dotted columns
+        dataframes = {org: future.result() for org, future in futures.items()}
+    logging.info(f"Fetched vendors data for {len(dataframes)} organizations")
 
-    # -------- Validate keys --------
-    for org, data in raw_data.items():
-        if not data or "vendors" not in data.keys():
+    # -------- Validate data --------
+    for org, dataframe in dataframes.items():
+        if dataframe is None:
             logging.error(f"No vendors data found for {org}.", exc_info=True)
             raise ValueError(f"No vendors data found for {org}.")
 
-    # -------- Extract main data --------
-    extracted_data = {org: raw_data[org]["vendors"] for org in valid_orgs if "vendors" in raw_data[org].keys()}
-    logging.debug(f"Extracted vendors data for {len(extracted_data)} organizations")
-
-    # -------- Convert to DataFrames --------
-    dataframes = {org: DataFrame(df) for org, df in extracted_data.items()}
-    logging.info("Loaded raw data into DataFrames.")
-
-    # -------- Normalize work_phone column --------
+    # -------- Data Cleaning & Formatting --------
+    org_keys = list(dataframes)
+    org_dtypes = {}
+    centers_by_key = config.get('centers_by_key', {})
     for org, dataframe in dataframes.items():
-        if 'work_phone' in dataframe.columns:
-            def normalize_phone(phone):
-                try:
-                    # Ensure phone is a dict; if not, return as-is or empty string
-                    if not isinstance(phone, dict):
-                        return str(phone) if phone else ''
-                    phone_code = phone.get('phone_code', 0)
-                    number = phone.get('number', '')
-                    # If number is empty, return empty string
-                    if not number:
-                        return ''
-                    # If phone_code is non-zero and valid, combine with number
-                    if phone_code and phone_code != 0:
-                        return f"{phone_code}{number}"
-                    # Otherwise, use number only
-                    return number
-                except Exception as e:
-                    logging.warning(f"Error normalizing phone {phone}: {e}")
-                    return ''
+        # Normalize work_phone into a single 'Work Phone' column
+        phone_parts = [column for column in dataframe.columns if column.startswith('work_phone.')]
+        if 'work_phone' in dataframe.columns or phone_parts:
+            if 'work_phone.number' in dataframe.columns:
+                numbers = dataframe['work_phone.number'].fillna('').astype(str)
+            else:
+                numbers = pd.Series('', index=dataframe.index)
+            if 'work_phone.phone_code' in dataframe.columns:
+                codes = dataframe['work_phone.phone_code']
+                if pd.api.types.is_float_dtype(codes):
+                    # Missing codes upcast integer codes to float; restore them before formatting
+                    codes = codes.astype('Int64')
+                # Compare codes as strings so values such as '+961' are kept verbatim
+                codes = codes.astype(object).where(codes.notna(), '').astype(str)
+            else:
+                codes = pd.Series('', index=dataframe.index)
+            
+            # Prefix the number with a phone_code ('' and '0' mean no code); empty numbers stay empty
+            has_code = ~codes.isin(['', '0'])
+            phones = np.where(has_code & numbers.ne(''), codes + numbers, numbers)
             
-            # Apply normalization to work_phone column
-            dataframe['work_phone'] = dataframe['work_phone'].apply(normalize_phone)
+            # Cells that were not dicts are left unflattened; keep their string form (empty if falsy)
+            if 'work_phone' in dataframe.columns:
+                raw = dataframe['work_phone']
+                phones = np.where(raw.notna() & raw.astype(bool), raw.astype(str), phones)
+                phone_parts.append('work_phone')
+            
+            # No column_index or column_order: Keep all columns from API response, renaming
+            # work_phone for clarity at the position the API returned it
+            phone_loc = min(dataframe.columns.get_loc(column) for column in phone_parts)
+            dataframe.drop(columns=phone_parts, inplace=True)
+            dataframe.insert(phone_loc, 'Work Phone', phones)
             logging.debug(f"Normalized work_phone column for {org}")
 
-    # -------- Data Cleaning & Formatting --------
-    for org, dataframe in dataframes.items():
-        # Convert date columns (if any, e.g., 'created_date')
-        # Example:
-        # if 'created_date' in dataframe.columns:
-        #     dataframe["created_date"] = pd.to_datetime(dataframe["created_date"])
-        #     dataframe["created_date"] = dataframe["created_date"].dt.strftime("%#m/%#d/%Y")
-
-        # No column_index or column_order: Keep all columns from API response
-        # Rename work_phone for clarity
-        if 'work_phone' in dataframe.columns:
-            dataframe.rename(columns={'work_phone': 'Work Phone'}, inplace=True)
+        # Convert date columns (if any, e.g., 'created_date'); unparseable values become blank.
+        # ISO8601 accepts any mix of ISO forms, and utc=True keeps mixed offsets datetimelike
+        if 'created_date' in dataframe.columns:
+            dataframe["created_date"] = pd.to_datetime(dataframe["created_date"], errors='coerce',
+                                                       format='ISO8601', utc=True)
+            dataframe["created_date"] = dataframe["created_date"].dt.strftime(REPORT_DATE_FORMAT)
+
+        # Map center IDs to names using config, falling back to the raw ID
+        if 'center_id' in dataframe.columns:
+            centers = centers_by_key.get(org_to_api_key[org], {})
+            dataframe['center_name'] = dataframe['center_id'].map(centers).fillna(dataframe['center_id'])
+            # Remove center_id to avoid duplication in output
+            dataframe.drop(columns='center_id', inplace=True)
         
         # Ensure center_name is included
         if 'center_name' not in dataframe.columns:
             dataframe['center_name'] = ''
 
-        dataframes[org] = dataframe
+        # Remember this organization's own columns so split_by_org can restore them after concat
+        org_dtypes[org] = dataframe.dtypes.to_dict()
 
-    return dataframes
+        # Tag rows with their organization; shared categories keep the dtype through concat
+        dataframe.insert(0, 'org', pd.Categorical([org] * len(dataframe), categories=org_keys))
+
+    frame = pd.concat(dataframes.values(), ignore_index=True)
+    
+    # center_name repeats a handful of values; store it as category codes.
+    # Cast after concat since frames with different categories would fall back to object
+    frame['center_name'] = frame['center_name'].astype('category')
+    frame.attrs['org_dtypes'] = org_dtypes
+    return frame
+
+def get_vendors_report(organizations: List[str] | str,
+                       start_date: datetime,
+                       end_date: datetime) -> Dict[str, DataFrame]:
+    """
+    Fetch and format vendor data for one or multiple organizations.
+
+    Args:
+        organizations (List[str] | str): Org key(s) such as ["lebanon", "kuwait"] or just "lebanon".
+        start_date (datetime): Start date of the report period.
+        end_date (datetime): End date of the report period.
+
+    Returns:
+        Dict[str, DataFrame]: Dictionary with org keys and cleaned DataFrames;
+        organizations without vendors are left out.
+    """
+    return drop_empty_orgs(get_vendors_frame(organizations, start_date, end_date))
 
 if __name__ == "__main__":
     set_logging()
@@ -201,11 +505,12 @@ if __name__ == "__main__":
     _end_date = datetime.today() - timedelta(days=1)
     _start_date = _end_date.replace(day=1)
 
-    # Generate the report
+    # Generate the report; empty organizations are dropped (and reported) once here
     _data = get_vendors_report(_organizations, _start_date, _end_date)
 
     # Export result to Excel
     name_ = "vendors"
     date_str = _end_date.strftime('%Y-%m-%d')
     output_dir = f"C:/Users/softwaredeveloper/Desktop/Silkor/Kunal Project/Data/{name_}/{date_str}"
-    export_orgs_to_excel(_data, output_dir, name_, date_str)
\ No newline at end of file
+    export_orgs_to_excel(_data, output_dir, name_, date_str)
+    export_orgs_to_parquet(_data, output_dir, name_, date_str)
\ No newline at end of file
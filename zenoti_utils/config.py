@@ -1,12 +1,22 @@
 import json
 import os
 import logging
+from functools import lru_cache
 from typing import Dict
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser when orjson is not installed
+    orjson = None
+
+@lru_cache(maxsize=1)
 def load_zenoti_config(config_path: str = "C:/Users/softwaredeveloper/Desktop/Silkor/Kunal Project/Config/zenoti_centers.json") -> Dict:
     """
     Load Zenoti configuration from a JSON file.
     
+    The result is cached per process, so callers share one dictionary and
+    must not mutate it. Use load_zenoti_config.cache_clear() to force a reload.
+    
     Args:
         config_path (str): Path to the configuration file.
     
@@ -15,15 +25,19 @@ def load_zenoti_config(config_path: str = "C:/Users/softwaredeveloper/Desktop/Si
     
     Raises:
         FileNotFoundError: If the config file is not found.
-        json.JSONDecodeError: If the config file is invalid JSON.
+        json.JSONDecodeError: If the config file is invalid JSON (orjson's error subclasses it).
     """
     if not os.path.exists(config_path):
         logging.error(f"Configuration file not found: {config_path}")
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        if orjson is not None:
+            with open(config_path, 'rb') as f:
+                config = orjson.loads(f.read())
+        else:
+            with open(config_path, 'r') as f:
+                config = json.load(f)
         logging.info(f"Loaded configuration from {config_path}")
         return config
     except json.JSONDecodeError as e: